@@ -1,25 +1,51 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+from sqlalchemy import func, or_, and_
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import List, Optional
 import bcrypt
 import secrets
-from datetime import  datetime
+from datetime import  datetime, timedelta
 
 from database import get_db, init_db
 from models import (
     User, Board, BoardMember, List as DBList, Card, 
-    Comment, Invite, CardAssignee, RoleEnum, InviteStatusEnum
+    Comment, Invite, CardAssignee, RoleEnum, InviteStatusEnum,
+    ArchivedList, ArchivedCard, ArchivedComment, ArchivedCardAssignee
 )
 from domain import (
     UserCreate, UserLogin, BoardCreate, BoardUpdate,
     ListCreate, ListUpdate, CardCreate, CardUpdate,
-    CommentCreate, InviteCreate, AssigneeCreate,
+    CommentCreate, InviteCreate, InviteBulkCreate, AssigneeCreate, MemberCreate,
     UserResponse, AuthResponse
 )
-from config import ALLOWED_ORIGINS
+from config import ALLOWED_ORIGINS, INVITE_EXPIRE_DAYS, ARCHIVE_PAGE_SIZE_MAX
+from tasks import start_background_jobs
+from ratelimit import AdmissionControlMiddleware
+from permissions import (
+    authz_cache, authorize_board, authorize_list, authorize_card,
+    board_id_for_list, board_id_for_card
+)
+from compression import CompressionMiddleware
+from cache import payload_cache, payload_response, board_version, bump_board_version
+
+# Background jobs run for the lifetime of the app
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    jobs = start_background_jobs()
+    yield
+    for job in jobs:
+        job.cancel()
+
+app = FastAPI(title="Trello Clone API", version="1.0.0", lifespan=lifespan)
 
-app = FastAPI(title="Trello Clone API", version="1.0.0")
+# Response compression (innermost, so compression work counts against the in-flight limit)
+app.add_middleware(CompressionMiddleware)
+
+# Admission control (added before CORS so CORS headers still wrap 429/503 responses)
+app.add_middleware(AdmissionControlMiddleware)
 
 # CORS middleware
 app.add_middleware(
@@ -48,6 +74,106 @@ def serialize_user(user: User) -> dict:
         "updated_at": user.updated_at.isoformat()
     }
 
+def serialize_invite(invite: Invite, include_token: bool = True) -> dict:
+    return {
+        "id": invite.id,
+        "board_id": invite.board_id,
+        "email": invite.email,
+        "token": invite.token if include_token else None,
+        "invited_by": invite.invited_by,
+        "status": invite.status.value,
+        "created_at": invite.created_at.isoformat(),
+        "expires_at": invite.expires_at.isoformat()
+    }
+
+def serialize_archived_list(list_obj, archived_at: datetime, archive_id: Optional[int] = None) -> dict:
+    return {
+        "id": list_obj.list_id if archive_id else list_obj.id,
+        "archive_id": archive_id,
+        "board_id": list_obj.board_id,
+        "title": list_obj.title,
+        "position": list_obj.position,
+        "archived_at": archived_at.isoformat(),
+        "created_at": list_obj.created_at.isoformat(),
+        "updated_at": list_obj.updated_at.isoformat()
+    }
+
+def serialize_archived_card(card, board_id: int, archived_at: datetime, archive_id: Optional[int] = None) -> dict:
+    return {
+        "id": card.card_id if archive_id else card.id,
+        "archive_id": archive_id,
+        "list_id": card.list_id,
+        "board_id": board_id,
+        "title": card.title,
+        "description": card.description,
+        "position": card.position,
+        "due_date": card.due_date.isoformat() if card.due_date else None,
+        "archived_at": archived_at.isoformat(),
+        "created_at": card.created_at.isoformat(),
+        "updated_at": card.updated_at.isoformat()
+    }
+
+def archive_page(hot: list, cold: list, limit: int) -> dict:
+    """Merge serialized items from live and archive tables into one keyset page"""
+    items = sorted(hot + cold, key=lambda x: (x["archived_at"], x["id"]), reverse=True)[:limit]
+    next_cursor = None
+    if len(items) == limit:
+        next_cursor = {"before_archived_at": items[-1]["archived_at"], "before_id": items[-1]["id"]}
+    return {"items": items, "next_cursor": next_cursor}
+
+def before_cursor(archived_at_col, id_col, before_archived_at: Optional[datetime], before_id: Optional[int]):
+    if before_id is None:
+        return archived_at_col < before_archived_at
+    return or_(archived_at_col < before_archived_at,
+               and_(archived_at_col == before_archived_at, id_col < before_id))
+
+def ensure_list_active(db: Session, list_id: int):
+    row = db.query(DBList.archived_at).filter(DBList.id == list_id).first()
+    if row and row.archived_at is not None:
+        raise HTTPException(status_code=400, detail="List is archived")
+
+def create_invites(db: Session, board_id: int, emails: List[str], inviter: User) -> List[Invite]:
+    """Create pending invites for `emails`, reusing live ones and skipping existing members.
+
+    Uses one lookup for existing members, one for live invites and a single
+    commit, so inviting a whole team costs the same round trips as one email.
+    """
+    emails = list(dict.fromkeys(e.strip().lower() for e in emails))
+    now = datetime.utcnow()
+    
+    member_emails = {row.email.lower() for row in db.query(User.email).join(
+        BoardMember, BoardMember.user_id == User.id
+    ).filter(BoardMember.board_id == board_id).all()}
+    pending = {i.email: i for i in db.query(Invite).filter(
+        Invite.board_id == board_id,
+        Invite.email.in_(emails),
+        Invite.status == InviteStatusEnum.pending,
+        Invite.expires_at > now
+    ).all()}
+    
+    invites, created = [], []
+    for email in emails:
+        if email in member_emails:
+            continue
+        invite = pending.get(email)
+        if invite is None:
+            invite = Invite(
+                board_id=board_id,
+                email=email,
+                token=secrets.token_urlsafe(32),
+                invited_by=inviter.id,
+                expires_at=now + timedelta(days=INVITE_EXPIRE_DAYS)
+            )
+            created.append(invite)
+        invites.append(invite)
+    
+    if created:
+        db.add_all(created)
+        db.commit()
+        for invite in created:
+            db.refresh(invite)
+    return invites
+
 # Mock authentication - returns first user
 def get_current_user(db: Session = Depends(get_db)) -> User:
     user = db.query(User).first()
@@ -55,6 +181,23 @@ def get_current_user(db: Session = Depends(get_db)) -> User:
         raise HTTPException(status_code=401, detail="Not authenticated")
     return user
 
+# Authorization dependencies
+def require_board_member(board_id: int, db: Session = Depends(get_db),
+                         current_user: User = Depends(get_current_user)) -> RoleEnum:
+    return authorize_board(db, current_user.id, board_id)
+
+def require_board_owner(board_id: int, db: Session = Depends(get_db),
+                        current_user: User = Depends(get_current_user)) -> RoleEnum:
+    return authorize_board(db, current_user.id, board_id, owner_only=True)
+
+def require_list_member(list_id: int, db: Session = Depends(get_db),
+                        current_user: User = Depends(get_current_user)) -> RoleEnum:
+    return authorize_list(db, current_user.id, list_id)
+
+def require_card_member(card_id: int, db: Session = Depends(get_db),
+                        current_user: User = Depends(get_current_user)) -> RoleEnum:
+    return authorize_card(db, current_user.id, card_id)
+
 # Health check
 @app.get("/")
 def health_check():
@@ -116,13 +259,14 @@ def create_board(board_data: BoardCreate, db: Session = Depends(get_db),
     member = BoardMember(board_id=board.id, user_id=current_user.id, role=RoleEnum.owner)
     db.add(member)
     db.commit()
+    authz_cache.forget_board(board.id)
     
     return {"id": board.id, "title": board.title, "description": board.description,
             "background_color": board.background_color, "owner_id": board.owner_id,
             "created_at": board.created_at.isoformat(), "updated_at": board.updated_at.isoformat()}
 
 @app.get("/api/boards/{board_id}")
-def get_board(board_id: int, db: Session = Depends(get_db)):
+def get_board(board_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_board_member)):
     board = db.query(Board).options(
         joinedload(Board.members).joinedload(BoardMember.user)
     ).filter(Board.id == board_id).first()
@@ -144,7 +288,8 @@ def get_board(board_id: int, db: Session = Depends(get_db)):
     }
 
 @app.put("/api/boards/{board_id}")
-def update_board(board_id: int, updates: BoardUpdate, db: Session = Depends(get_db)):
+def update_board(board_id: int, updates: BoardUpdate, db: Session = Depends(get_db),
+                 _: RoleEnum = Depends(require_board_owner)):
     board = db.query(Board).filter(Board.id == board_id).first()
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
@@ -159,20 +304,33 @@ def update_board(board_id: int, updates: BoardUpdate, db: Session = Depends(get_
             "created_at": board.created_at.isoformat(), "updated_at": board.updated_at.isoformat()}
 
 @app.delete("/api/boards/{board_id}")
-def delete_board(board_id: int, db: Session = Depends(get_db)):
+def delete_board(board_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_board_owner)):
     board = db.query(Board).filter(Board.id == board_id).first()
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
     db.delete(board)
     db.commit()
+    authz_cache.forget_board(board_id)
+    payload_cache.forget(board_id)
     return {"message": "Board deleted"}
 
 # List endpoints
 @app.get("/api/boards/{board_id}/lists")
-def get_lists(board_id: int, db: Session = Depends(get_db)):
+def get_lists(board_id: int, request: Request, db: Session = Depends(get_db),
+              _: RoleEnum = Depends(require_board_member)):
+    version = board_version(db, board_id)
+    entry = payload_cache.get(board_id, version)
+    if entry is None:
+        entry = payload_cache.put(board_id, version, JSONResponse(serialize_lists(db, board_id)).body)
+    return payload_response(entry, request)
+
+def serialize_lists(db: Session, board_id: int) -> list:
     lists = db.query(DBList).options(
-        joinedload(DBList.cards)
-    ).filter(DBList.board_id == board_id).order_by(DBList.position).all()
+        joinedload(DBList.cards.and_(Card.archived_at.is_(None)))
+    ).filter(
+        DBList.board_id == board_id,
+        DBList.archived_at.is_(None)
+    ).order_by(DBList.position).all()
     
     return [{
         "id": l.id,
@@ -188,17 +346,22 @@ def get_lists(board_id: int, db: Session = Depends(get_db)):
     } for l in lists]
 
 @app.post("/api/lists")
-def create_list(list_data: ListCreate, db: Session = Depends(get_db)):
+def create_list(list_data: ListCreate, db: Session = Depends(get_db),
+                current_user: User = Depends(get_current_user)):
+    authorize_board(db, current_user.id, list_data.board_id)
     new_list = DBList(**list_data.dict())
     db.add(new_list)
+    bump_board_version(db, new_list.board_id)
     db.commit()
     db.refresh(new_list)
+    authz_cache.forget_list(new_list.id)
     return {"id": new_list.id, "board_id": new_list.board_id, "title": new_list.title,
             "position": new_list.position, "created_at": new_list.created_at.isoformat(),
             "updated_at": new_list.updated_at.isoformat()}
 
 @app.put("/api/lists/{list_id}")
-def update_list(list_id: int, updates: ListUpdate, db: Session = Depends(get_db)):
+def update_list(list_id: int, updates: ListUpdate, db: Session = Depends(get_db),
+                _: RoleEnum = Depends(require_list_member)):
     list_obj = db.query(DBList).filter(DBList.id == list_id).first()
     if not list_obj:
         raise HTTPException(status_code=404, detail="List not found")
@@ -206,6 +369,7 @@ def update_list(list_id: int, updates: ListUpdate, db: Session = Depends(get_db)
     for key, value in updates.dict(exclude_unset=True).items():
         setattr(list_obj, key, value)
     
+    bump_board_version(db, list_obj.board_id)
     db.commit()
     db.refresh(list_obj)
     return {"id": list_obj.id, "board_id": list_obj.board_id, "title": list_obj.title,
@@ -213,27 +377,34 @@ def update_list(list_id: int, updates: ListUpdate, db: Session = Depends(get_db)
             "updated_at": list_obj.updated_at.isoformat()}
 
 @app.delete("/api/lists/{list_id}")
-def delete_list(list_id: int, db: Session = Depends(get_db)):
+def delete_list(list_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_list_member)):
     list_obj = db.query(DBList).filter(DBList.id == list_id).first()
     if not list_obj:
         raise HTTPException(status_code=404, detail="List not found")
     db.delete(list_obj)
+    bump_board_version(db, list_obj.board_id)
     db.commit()
+    authz_cache.forget_list(list_id)
     return {"message": "List deleted"}
 
 # Card endpoints
 @app.post("/api/cards")
-def create_card(card_data: CardCreate, db: Session = Depends(get_db)):
+def create_card(card_data: CardCreate, db: Session = Depends(get_db),
+                current_user: User = Depends(get_current_user)):
+    authorize_list(db, current_user.id, card_data.list_id)
+    ensure_list_active(db, card_data.list_id)
     card = Card(**card_data.dict())
     db.add(card)
+    bump_board_version(db, board_id_for_list(db, card_data.list_id))
     db.commit()
     db.refresh(card)
+    authz_cache.forget_card(card.id)
     return {"id": card.id, "list_id": card.list_id, "title": card.title, "description": card.description,
             "position": card.position, "due_date": card.due_date.isoformat() if card.due_date else None,
             "created_at": card.created_at.isoformat(), "updated_at": card.updated_at.isoformat()}
 
 @app.get("/api/cards/{card_id}")
-def get_card(card_id: int, db: Session = Depends(get_db)):
+def get_card(card_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_card_member)):
     card = db.query(Card).options(
         joinedload(Card.assignees).joinedload(CardAssignee.user),
         joinedload(Card.comments).joinedload(Comment.user)
@@ -249,6 +420,7 @@ def get_card(card_id: int, db: Session = Depends(get_db)):
         "description": card.description,
         "position": card.position,
         "due_date": card.due_date.isoformat() if card.due_date else None,
+        "archived_at": card.archived_at.isoformat() if card.archived_at else None,
         "created_at": card.created_at.isoformat(),
         "updated_at": card.updated_at.isoformat(),
         "assignees": [{"id": a.id, "card_id": a.card_id, "user_id": a.user_id,
@@ -260,26 +432,40 @@ def get_card(card_id: int, db: Session = Depends(get_db)):
     }
 
 @app.put("/api/cards/{card_id}")
-def update_card(card_id: int, updates: CardUpdate, db: Session = Depends(get_db)):
+def update_card(card_id: int, updates: CardUpdate, db: Session = Depends(get_db),
+                current_user: User = Depends(get_current_user),
+                _: RoleEnum = Depends(require_card_member)):
     card = db.query(Card).filter(Card.id == card_id).first()
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
     
+    board_ids = {board_id_for_card(db, card_id)}
+    moved = updates.list_id is not None and updates.list_id != card.list_id
+    if moved:
+        board_ids.add(board_id_for_list(db, updates.list_id))
+        authorize_list(db, current_user.id, updates.list_id)
+        ensure_list_active(db, updates.list_id)
+    
     for key, value in updates.dict(exclude_unset=True).items():
         setattr(card, key, value)
     
+    bump_board_version(db, *board_ids)
     db.commit()
     db.refresh(card)
+    if moved:
+        authz_cache.forget_card(card_id)
     return {"id": card.id, "list_id": card.list_id, "title": card.title, "description": card.description,
             "position": card.position, "due_date": card.due_date.isoformat() if card.due_date else None,
             "created_at": card.created_at.isoformat(), "updated_at": card.updated_at.isoformat()}
 
 @app.delete("/api/cards/{card_id}")
-def delete_card(card_id: int, db: Session = Depends(get_db)):
+def delete_card(card_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_card_member)):
     card = db.query(Card).filter(Card.id == card_id).first()
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
+    board_id = board_id_for_card(db, card_id)
     db.delete(card)
+    bump_board_version(db, board_id)
     db.commit()
     return {"message": "Card deleted"}
 
@@ -287,6 +473,7 @@ def delete_card(card_id: int, db: Session = Depends(get_db)):
 @app.post("/api/comments")
 def create_comment(comment_data: CommentCreate, db: Session = Depends(get_db),
                   current_user: User = Depends(get_current_user)):
+    authorize_card(db, current_user.id, comment_data.card_id)
     comment = Comment(**comment_data.dict(), user_id=current_user.id)
     db.add(comment)
     db.commit()
@@ -297,17 +484,20 @@ def create_comment(comment_data: CommentCreate, db: Session = Depends(get_db),
             "updated_at": comment.updated_at.isoformat(), "user": serialize_user(current_user)}
 
 @app.delete("/api/comments/{comment_id}")
-def delete_comment(comment_id: int, db: Session = Depends(get_db)):
+def delete_comment(comment_id: int, db: Session = Depends(get_db),
+                   current_user: User = Depends(get_current_user)):
     comment = db.query(Comment).filter(Comment.id == comment_id).first()
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
+    authorize_card(db, current_user.id, comment.card_id)
     db.delete(comment)
     db.commit()
     return {"message": "Comment deleted"}
 
 # Board members endpoints
 @app.get("/api/boards/{board_id}/members")
-def get_board_members(board_id: int, db: Session = Depends(get_db)):
+def get_board_members(board_id: int, db: Session = Depends(get_db),
+                      _: RoleEnum = Depends(require_board_member)):
     members = db.query(BoardMember).options(
         joinedload(BoardMember.user)
     ).filter(BoardMember.board_id == board_id).all()
@@ -316,29 +506,45 @@ def get_board_members(board_id: int, db: Session = Depends(get_db)):
              "joined_at": m.joined_at.isoformat(), "user": serialize_user(m.user)} for m in members]
 
 @app.post("/api/boards/{board_id}/members")
-def add_board_member(board_id: int, data: dict, db: Session = Depends(get_db)):
-    member = BoardMember(board_id=board_id, user_id=data["user_id"], role=RoleEnum.member)
+def add_board_member(board_id: int, data: MemberCreate, db: Session = Depends(get_db),
+                     _: RoleEnum = Depends(require_board_owner)):
+    if not db.query(User.id).filter(User.id == data.user_id).first():
+        raise HTTPException(status_code=404, detail="User not found")
+    existing = db.query(BoardMember.id).filter(
+        BoardMember.board_id == board_id,
+        BoardMember.user_id == data.user_id
+    ).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="User is already a board member")
+    
+    member = BoardMember(board_id=board_id, user_id=data.user_id, role=RoleEnum.member)
     db.add(member)
     db.commit()
     db.refresh(member)
+    authz_cache.forget_member(member.user_id, board_id)
     return {"id": member.id, "board_id": member.board_id, "user_id": member.user_id,
             "role": member.role.value, "joined_at": member.joined_at.isoformat()}
 
 @app.delete("/api/boards/{board_id}/members/{member_id}")
-def remove_board_member(board_id: int, member_id: int, db: Session = Depends(get_db)):
+def remove_board_member(board_id: int, member_id: int, db: Session = Depends(get_db),
+                        _: RoleEnum = Depends(require_board_owner)):
     member = db.query(BoardMember).filter(
         BoardMember.id == member_id, 
         BoardMember.board_id == board_id
     ).first()
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
+    if member.role == RoleEnum.owner:
+        raise HTTPException(status_code=400, detail="The board owner cannot be removed")
     db.delete(member)
     db.commit()
+    authz_cache.forget_member(member.user_id, board_id)
     return {"message": "Member removed"}
 
 # Card assignee endpoints
 @app.post("/api/cards/{card_id}/assignees")
-def assign_card(card_id: int, data: AssigneeCreate, db: Session = Depends(get_db)):
+def assign_card(card_id: int, data: AssigneeCreate, db: Session = Depends(get_db),
+                _: RoleEnum = Depends(require_card_member)):
     assignee = CardAssignee(card_id=card_id, user_id=data.user_id)
     db.add(assignee)
     db.commit()
@@ -347,7 +553,8 @@ def assign_card(card_id: int, data: AssigneeCreate, db: Session = Depends(get_db
             "assigned_at": assignee.assigned_at.isoformat()}
 
 @app.delete("/api/cards/{card_id}/assignees/{assignee_id}")
-def unassign_card(card_id: int, assignee_id: int, db: Session = Depends(get_db)):
+def unassign_card(card_id: int, assignee_id: int, db: Session = Depends(get_db),
+                  _: RoleEnum = Depends(require_card_member)):
     assignee = db.query(CardAssignee).filter(
         CardAssignee.id == assignee_id,
         CardAssignee.card_id == card_id
@@ -358,6 +565,180 @@ def unassign_card(card_id: int, assignee_id: int, db: Session = Depends(get_db))
     db.commit()
     return {"message": "Assignee removed"}
 
+# Archive endpoints
+@app.post("/api/lists/{list_id}/archive")
+def archive_list(list_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_list_member)):
+    list_obj = db.query(DBList).filter(DBList.id == list_id).first()
+    if not list_obj:
+        raise HTTPException(status_code=404, detail="List not found")
+    if list_obj.archived_at is None:
+        list_obj.archived_at = datetime.utcnow()
+        bump_board_version(db, list_obj.board_id)
+        db.commit()
+        db.refresh(list_obj)
+    return serialize_archived_list(list_obj, list_obj.archived_at)
+
+@app.post("/api/lists/{list_id}/unarchive")
+def unarchive_list(list_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_list_member)):
+    list_obj = db.query(DBList).filter(DBList.id == list_id).first()
+    if not list_obj:
+        raise HTTPException(status_code=404, detail="List not found")
+    list_obj.archived_at = None
+    bump_board_version(db, list_obj.board_id)
+    db.commit()
+    db.refresh(list_obj)
+    return {"id": list_obj.id, "board_id": list_obj.board_id, "title": list_obj.title,
+            "position": list_obj.position, "created_at": list_obj.created_at.isoformat(),
+            "updated_at": list_obj.updated_at.isoformat()}
+
+@app.post("/api/cards/{card_id}/archive")
+def archive_card(card_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_card_member)):
+    card = db.query(Card).options(joinedload(Card.list)).filter(Card.id == card_id).first()
+    if not card:
+        raise HTTPException(status_code=404, detail="Card not found")
+    if card.archived_at is None:
+        card.archived_at = datetime.utcnow()
+        bump_board_version(db, card.list.board_id)
+        db.commit()
+        db.refresh(card)
+    return serialize_archived_card(card, card.list.board_id, card.archived_at)
+
+@app.post("/api/cards/{card_id}/unarchive")
+def unarchive_card(card_id: int, db: Session = Depends(get_db), _: RoleEnum = Depends(require_card_member)):
+    card = db.query(Card).filter(Card.id == card_id).first()
+    if not card:
+        raise HTTPException(status_code=404, detail="Card not found")
+    ensure_list_active(db, card.list_id)
+    card.archived_at = None
+    bump_board_version(db, board_id_for_card(db, card_id))
+    db.commit()
+    db.refresh(card)
+    return {"id": card.id, "list_id": card.list_id, "title": card.title, "description": card.description,
+            "position": card.position, "due_date": card.due_date.isoformat() if card.due_date else None,
+            "created_at": card.created_at.isoformat(), "updated_at": card.updated_at.isoformat()}
+
+@app.get("/api/boards/{board_id}/archive/lists")
+def get_archived_lists(board_id: int, limit: int = 50, before_archived_at: Optional[datetime] = None,
+                       before_id: Optional[int] = None, db: Session = Depends(get_db),
+                       _: RoleEnum = Depends(require_board_member)):
+    limit = max(1, min(limit, ARCHIVE_PAGE_SIZE_MAX))
+    hot = db.query(DBList).filter(DBList.board_id == board_id, DBList.archived_at.isnot(None))
+    cold = db.query(ArchivedList).filter(ArchivedList.board_id == board_id)
+    if before_archived_at:
+        hot = hot.filter(before_cursor(DBList.archived_at, DBList.id, before_archived_at, before_id))
+        cold = cold.filter(before_cursor(ArchivedList.archived_at, ArchivedList.list_id,
+                                         before_archived_at, before_id))
+    hot = hot.order_by(DBList.archived_at.desc(), DBList.id.desc()).limit(limit).all()
+    cold = cold.order_by(ArchivedList.archived_at.desc(), ArchivedList.list_id.desc()).limit(limit).all()
+    
+    return archive_page(
+        [serialize_archived_list(l, l.archived_at) for l in hot],
+        [serialize_archived_list(l, l.archived_at, archive_id=l.id) for l in cold],
+        limit
+    )
+
+@app.get("/api/boards/{board_id}/archive/cards")
+def get_archived_cards(board_id: int, limit: int = 50, before_archived_at: Optional[datetime] = None,
+                       before_id: Optional[int] = None, db: Session = Depends(get_db),
+                       _: RoleEnum = Depends(require_board_member)):
+    """Archived cards, including those archived along with their list, newest first"""
+    limit = max(1, min(limit, ARCHIVE_PAGE_SIZE_MAX))
+    archived_at = func.coalesce(Card.archived_at, DBList.archived_at)
+    hot = db.query(Card, archived_at).join(DBList, Card.list_id == DBList.id).filter(
+        DBList.board_id == board_id,
+        archived_at.isnot(None)
+    )
+    cold = db.query(ArchivedCard).filter(ArchivedCard.board_id == board_id)
+    if before_archived_at:
+        hot = hot.filter(before_cursor(archived_at, Card.id, before_archived_at, before_id))
+        cold = cold.filter(before_cursor(ArchivedCard.archived_at, ArchivedCard.card_id,
+                                         before_archived_at, before_id))
+    hot = hot.order_by(archived_at.desc(), Card.id.desc()).limit(limit).all()
+    cold = cold.order_by(ArchivedCard.archived_at.desc(), ArchivedCard.card_id.desc()).limit(limit).all()
+    
+    return archive_page(
+        [serialize_archived_card(c, board_id, at) for c, at in hot],
+        [serialize_archived_card(c, board_id, c.archived_at, archive_id=c.id) for c in cold],
+        limit
+    )
+
+@app.get("/api/archive/cards/{archive_id}")
+def get_archived_card(archive_id: int, db: Session = Depends(get_db),
+                      current_user: User = Depends(get_current_user)):
+    card = db.query(ArchivedCard).options(
+        joinedload(ArchivedCard.assignees).joinedload(ArchivedCardAssignee.user),
+        joinedload(ArchivedCard.comments).joinedload(ArchivedComment.user)
+    ).filter(ArchivedCard.id == archive_id).first()
+    if not card:
+        raise HTTPException(status_code=404, detail="Archived card not found")
+    authorize_board(db, current_user.id, card.board_id)
+    
+    return {
+        **serialize_archived_card(card, card.board_id, card.archived_at, archive_id=card.id),
+        "assignees": [{"user_id": a.user_id, "assigned_at": a.assigned_at.isoformat(),
+                       "user": serialize_user(a.user)} for a in card.assignees],
+        "comments": [{"id": c.comment_id, "user_id": c.user_id, "content": c.content,
+                      "created_at": c.created_at.isoformat(), "updated_at": c.updated_at.isoformat(),
+                      "user": serialize_user(c.user)} for c in card.comments]
+    }
+
+# Invite endpoints
+@app.post("/api/invites")
+def create_invite(invite_data: InviteCreate, db: Session = Depends(get_db),
+                  current_user: User = Depends(get_current_user)):
+    authorize_board(db, current_user.id, invite_data.board_id, owner_only=True)
+    
+    invites = create_invites(db, invite_data.board_id, [invite_data.email], current_user)
+    if not invites:
+        raise HTTPException(status_code=400, detail="User is already a board member")
+    return serialize_invite(invites[0])
+
+@app.post("/api/invites/bulk")
+def create_invites_bulk(invite_data: InviteBulkCreate, db: Session = Depends(get_db),
+                        current_user: User = Depends(get_current_user)):
+    authorize_board(db, current_user.id, invite_data.board_id, owner_only=True)
+    
+    invites = create_invites(db, invite_data.board_id, invite_data.emails, current_user)
+    return [serialize_invite(i) for i in invites]
+
+@app.post("/api/invites/{token}/accept")
+def accept_invite(token: str, db: Session = Depends(get_db),
+                  current_user: User = Depends(get_current_user)):
+    invite = db.query(Invite).filter(Invite.token == token).first()
+    if not invite:
+        raise HTTPException(status_code=404, detail="Invite not found")
+    if invite.email != current_user.email.lower():
+        raise HTTPException(status_code=403, detail="Invite was sent to a different email")
+    
+    if invite.status == InviteStatusEnum.pending and invite.expires_at <= datetime.utcnow():
+        # The sweeper may not have reached this row yet
+        invite.status = InviteStatusEnum.expired
+        db.commit()
+    if invite.status == InviteStatusEnum.expired:
+        raise HTTPException(status_code=410, detail="Invite has expired")
+    if invite.status == InviteStatusEnum.accepted:
+        raise HTTPException(status_code=400, detail="Invite already accepted")
+    
+    existing = db.query(BoardMember.id).filter(
+        BoardMember.board_id == invite.board_id,
+        BoardMember.user_id == current_user.id
+    ).first()
+    if not existing:
+        db.add(BoardMember(board_id=invite.board_id, user_id=current_user.id, role=RoleEnum.member))
+    invite.status = InviteStatusEnum.accepted
+    db.commit()
+    authz_cache.forget_member(current_user.id, invite.board_id)
+    return {"message": "Invite accepted", "board_id": invite.board_id}
+
+@app.get("/api/boards/{board_id}/invites")
+def get_board_invites(board_id: int, db: Session = Depends(get_db),
+                      role: RoleEnum = Depends(require_board_member)):
+    invites = db.query(Invite).filter(
+        Invite.board_id == board_id
+    ).order_by(Invite.created_at.desc()).all()
+    # Tokens grant membership, so only owners may see them
+    return [serialize_invite(i, include_token=role == RoleEnum.owner) for i in invites]
+
 if __name__ == "__main__":
     import uvicorn
     print("Starting Trello Clone API server...")
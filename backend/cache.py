@@ -0,0 +1,92 @@
+"""Versioned cache of serialized board payloads with precompressed variants"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import Response
+
+from models import Board
+from compression import negotiate_encoding, compress
+from config import PAYLOAD_CACHE_MAX_ENTRIES, COMPRESSION_MIN_SIZE
+
+class CachedPayload:
+    __slots__ = ("version", "etag", "body", "variants")
+
+    def __init__(self, version: int, body: bytes):
+        self.version = version
+        self.etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        self.body = body
+        # encoding -> compressed body, filled on first request for that encoding
+        self.variants = {}
+
+class PayloadCache:
+    """LRU of serialized payloads per board, validated against the board's `version` column"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def forget(self, board_id: int):
+        with self.lock:
+            self.entries.pop(board_id, None)
+
+    def get(self, board_id: int, version: int) -> Optional[CachedPayload]:
+        with self.lock:
+            entry = self.entries.get(board_id)
+            if entry is None or entry.version != version:
+                return None
+            self.entries.move_to_end(board_id)
+            return entry
+
+    def put(self, board_id: int, version: int, body: bytes) -> CachedPayload:
+        entry = CachedPayload(version, body)
+        with self.lock:
+            current = self.entries.get(board_id)
+            if current is None or current.version <= version:
+                self.entries[board_id] = entry
+                self.entries.move_to_end(board_id)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return entry
+
+payload_cache = PayloadCache(PAYLOAD_CACHE_MAX_ENTRIES)
+
+def board_version(db: Session, board_id: int) -> int:
+    row = db.query(Board.version).filter(Board.id == board_id).first()
+    return row.version if row else 0
+
+def bump_board_version(db: Session, *board_ids: int):
+    """Increment the boards' payload version in the caller's transaction"""
+    db.query(Board).filter(Board.id.in_(board_ids)).update(
+        # Keep updated_at as is: list/card changes are not edits to the board itself
+        {Board.version: Board.version + 1, Board.updated_at: Board.updated_at},
+        synchronize_session=False
+    )
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag[2:] in [t[2:] if t.startswith("W/") else t for t in tags]
+
+def payload_response(entry: CachedPayload, request: Request) -> Response:
+    """Serve a cached payload, reusing its compressed bytes and honouring If-None-Match"""
+    headers = {"ETag": entry.etag, "Vary": "Accept-Encoding"}
+    if etag_matches(entry.etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+
+    encoding = None
+    if len(entry.body) >= COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return Response(entry.body, media_type="application/json", headers=headers)
+
+    body = entry.variants.get(encoding)
+    if body is None:
+        body = entry.variants[encoding] = compress(entry.body, encoding)
+    headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
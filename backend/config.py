@@ -10,6 +10,51 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# Invite configuration
+INVITE_EXPIRE_DAYS = int(os.getenv("INVITE_EXPIRE_DAYS", "7"))
+INVITE_BULK_MAX = int(os.getenv("INVITE_BULK_MAX", "100"))
+INVITE_SWEEP_INTERVAL_SECONDS = int(os.getenv("INVITE_SWEEP_INTERVAL_SECONDS", "300"))
+INVITE_SWEEP_BATCH_SIZE = int(os.getenv("INVITE_SWEEP_BATCH_SIZE", "500"))
+
+# Admission control: (tokens per second, burst) per route class, applied per user
+RATE_LIMITS = {
+    "auth": (float(os.getenv("RATE_LIMIT_AUTH_RATE", "0.5")), int(os.getenv("RATE_LIMIT_AUTH_BURST", "10"))),
+    "read": (float(os.getenv("RATE_LIMIT_READ_RATE", "20")), int(os.getenv("RATE_LIMIT_READ_BURST", "100"))),
+    "write": (float(os.getenv("RATE_LIMIT_WRITE_RATE", "10")), int(os.getenv("RATE_LIMIT_WRITE_BURST", "50"))),
+}
+# Looser per-IP limits, since several users may share one address behind a NAT or proxy
+IP_RATE_LIMITS = {
+    "auth": (float(os.getenv("RATE_LIMIT_AUTH_IP_RATE", "2")), int(os.getenv("RATE_LIMIT_AUTH_IP_BURST", "30"))),
+    "read": (float(os.getenv("RATE_LIMIT_READ_IP_RATE", "100")), int(os.getenv("RATE_LIMIT_READ_IP_BURST", "500"))),
+    "write": (float(os.getenv("RATE_LIMIT_WRITE_IP_RATE", "50")), int(os.getenv("RATE_LIMIT_WRITE_IP_BURST", "250"))),
+}
+RATE_LIMIT_IDLE_SECONDS = int(os.getenv("RATE_LIMIT_IDLE_SECONDS", "600"))
+RATE_LIMIT_CLEANUP_SECONDS = int(os.getenv("RATE_LIMIT_CLEANUP_SECONDS", "60"))
+RATE_LIMIT_MAX_BUCKETS = int(os.getenv("RATE_LIMIT_MAX_BUCKETS", "100000"))
+MAX_IN_FLIGHT_REQUESTS = int(os.getenv("MAX_IN_FLIGHT_REQUESTS", "64"))
+MAX_QUEUED_REQUESTS = int(os.getenv("MAX_QUEUED_REQUESTS", "128"))
+QUEUE_TIMEOUT_SECONDS = float(os.getenv("QUEUE_TIMEOUT_SECONDS", "2"))
+
+# Archive configuration: archived rows older than this move to the archive tables
+ARCHIVE_MOVE_AFTER_DAYS = int(os.getenv("ARCHIVE_MOVE_AFTER_DAYS", "30"))
+ARCHIVE_INTERVAL_SECONDS = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", "3600"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "200"))
+ARCHIVE_PAGE_SIZE_MAX = int(os.getenv("ARCHIVE_PAGE_SIZE_MAX", "100"))
+
+# Authorization cache
+AUTHZ_CACHE_TTL_SECONDS = int(os.getenv("AUTHZ_CACHE_TTL_SECONDS", "60"))
+AUTHZ_CACHE_MAX_ENTRIES = int(os.getenv("AUTHZ_CACHE_MAX_ENTRIES", "100000"))
+
+# Response compression
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_OFFLOAD_SIZE = int(os.getenv("COMPRESSION_OFFLOAD_SIZE", str(64 * 1024)))  # compress in threadpool
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))
+
+# Board payload cache
+PAYLOAD_CACHE_MAX_ENTRIES = int(os.getenv("PAYLOAD_CACHE_MAX_ENTRIES", "1000"))
+
 # CORS configuration
 ALLOWED_ORIGINS = [
     "http://localhost:3000",
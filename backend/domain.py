@@ -1,7 +1,9 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field
+from typing import Optional, List
 from datetime import datetime
 
+from config import INVITE_BULK_MAX
+
 # Request models
 class UserCreate(BaseModel):
     email: EmailStr
@@ -53,9 +55,16 @@ class InviteCreate(BaseModel):
     board_id: int
     email: EmailStr
 
+class InviteBulkCreate(BaseModel):
+    board_id: int
+    emails: List[EmailStr] = Field(..., max_length=INVITE_BULK_MAX)
+
 class AssigneeCreate(BaseModel):
     user_id: int
 
+class MemberCreate(BaseModel):
+    user_id: int
+
 # Response models
 class UserResponse(BaseModel):
     id: int
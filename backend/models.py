@@ -1,9 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 import enum
 
+from config import INVITE_EXPIRE_DAYS
+
 Base = declarative_base()
 
 # Enums
@@ -42,6 +44,8 @@ class Board(Base):
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     background_color = Column(String, default="#0079bf")
+    # Bumped on every list/card write; versions the cached `get_lists` payload
+    version = Column(Integer, nullable=False, default=0, server_default="0")
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -51,6 +55,8 @@ class Board(Base):
     members = relationship("BoardMember", back_populates="board", cascade="all, delete-orphan")
     lists = relationship("List", back_populates="board", cascade="all, delete-orphan")
     invites = relationship("Invite", back_populates="board", cascade="all, delete-orphan")
+    archived_lists = relationship("ArchivedList", cascade="all, delete-orphan")
+    archived_cards = relationship("ArchivedCard", cascade="all, delete-orphan")
 
 class BoardMember(Base):
     __tablename__ = "board_members"
@@ -67,11 +73,14 @@ class BoardMember(Base):
 
 class List(Base):
     __tablename__ = "lists"
+    # Never reuse ids: archived rows keep their original id in the archive tables
+    __table_args__ = {"sqlite_autoincrement": True}
     
     id = Column(Integer, primary_key=True, index=True)
     board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
     title = Column(String, nullable=False)
     position = Column(Integer, nullable=False)
+    archived_at = Column(DateTime, nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -81,6 +90,7 @@ class List(Base):
 
 class Card(Base):
     __tablename__ = "cards"
+    __table_args__ = {"sqlite_autoincrement": True}
     
     id = Column(Integer, primary_key=True, index=True)
     list_id = Column(Integer, ForeignKey("lists.id"), nullable=False)
@@ -88,6 +98,7 @@ class Card(Base):
     description = Column(Text, nullable=True)
     position = Column(Integer, nullable=False)
     due_date = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -110,6 +121,7 @@ class CardAssignee(Base):
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = {"sqlite_autoincrement": True}
     
     id = Column(Integer, primary_key=True, index=True)
     card_id = Column(Integer, ForeignKey("cards.id"), nullable=False)
@@ -124,15 +136,84 @@ class Comment(Base):
 
 class Invite(Base):
     __tablename__ = "invites"
+    __table_args__ = (
+        # Serves the expiry sweeper: pending rows ordered by expiry
+        Index("ix_invites_status_expires_at", "status", "expires_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
+    board_id = Column(Integer, ForeignKey("boards.id"), nullable=False, index=True)
     email = Column(String, nullable=False)
-    token = Column(String, unique=True, nullable=False)
+    token = Column(String, unique=True, index=True, nullable=False)
     invited_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     status = Column(Enum(InviteStatusEnum), default=InviteStatusEnum.pending)
     created_at = Column(DateTime, default=datetime.utcnow)
-    expires_at = Column(DateTime, default=lambda: datetime.utcnow() + timedelta(days=7))
+    expires_at = Column(DateTime, default=lambda: datetime.utcnow() + timedelta(days=INVITE_EXPIRE_DAYS))
     
     # Relationships
     board = relationship("Board", back_populates="invites")
+
+# Archive tables: cold storage for archived lists and cards, kept out of the hot tables
+class ArchivedList(Base):
+    __tablename__ = "archived_lists"
+    __table_args__ = (
+        Index("ix_archived_lists_board_archived_at", "board_id", "archived_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    list_id = Column(Integer, nullable=False)
+    board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
+    title = Column(String, nullable=False)
+    position = Column(Integer, nullable=False)
+    archived_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+
+class ArchivedCard(Base):
+    __tablename__ = "archived_cards"
+    __table_args__ = (
+        Index("ix_archived_cards_board_archived_at", "board_id", "archived_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    card_id = Column(Integer, nullable=False)
+    list_id = Column(Integer, nullable=False)
+    board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    position = Column(Integer, nullable=False)
+    due_date = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    
+    # Relationships
+    assignees = relationship("ArchivedCardAssignee", back_populates="card", cascade="all, delete-orphan")
+    comments = relationship("ArchivedComment", back_populates="card", cascade="all, delete-orphan")
+
+class ArchivedCardAssignee(Base):
+    __tablename__ = "archived_card_assignees"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    archived_card_id = Column(Integer, ForeignKey("archived_cards.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    assigned_at = Column(DateTime)
+    
+    # Relationships
+    card = relationship("ArchivedCard", back_populates="assignees")
+    user = relationship("User")
+
+class ArchivedComment(Base):
+    __tablename__ = "archived_comments"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    archived_card_id = Column(Integer, ForeignKey("archived_cards.id"), nullable=False, index=True)
+    comment_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    
+    # Relationships
+    card = relationship("ArchivedCard", back_populates="comments")
+    user = relationship("User")
@@ -0,0 +1,111 @@
+"""Board-membership authorization backed by an in-process cache"""
+import time
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from models import Board, BoardMember, List as DBList, Card, RoleEnum
+from config import AUTHZ_CACHE_TTL_SECONDS, AUTHZ_CACHE_MAX_ENTRIES
+
+_MISSING = object()
+
+class AuthorizationCache:
+    """Caches (user_id, board_id) -> role and list/card -> board_id lookups with a TTL"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.roles = {}
+        self.list_boards = {}
+        self.card_boards = {}
+
+    def get(self, table: dict, key):
+        entry = table.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            return _MISSING
+        return entry[0]
+
+    def put(self, table: dict, key, value):
+        if len(table) >= self.max_entries:
+            table.clear()
+        table[key] = (value, time.monotonic() + self.ttl_seconds)
+
+    def forget_member(self, user_id: int, board_id: int):
+        self.roles.pop((user_id, board_id), None)
+
+    def forget_list(self, list_id: int):
+        self.list_boards.pop(list_id, None)
+
+    def forget_card(self, card_id: int):
+        self.card_boards.pop(card_id, None)
+
+    def forget_board(self, board_id: int):
+        for table, matches in (
+            (self.roles, lambda key, value: key[1] == board_id),
+            (self.list_boards, lambda key, value: value == board_id),
+            (self.card_boards, lambda key, value: value == board_id),
+        ):
+            for key in [k for k, (v, _) in list(table.items()) if matches(k, v)]:
+                table.pop(key, None)
+
+    def clear(self):
+        self.roles.clear()
+        self.list_boards.clear()
+        self.card_boards.clear()
+
+authz_cache = AuthorizationCache(AUTHZ_CACHE_TTL_SECONDS, AUTHZ_CACHE_MAX_ENTRIES)
+
+def board_id_for_list(db: Session, list_id: int) -> int:
+    board_id = authz_cache.get(authz_cache.list_boards, list_id)
+    if board_id is _MISSING:
+        row = db.query(DBList.board_id).filter(DBList.id == list_id).first()
+        if not row:
+            raise HTTPException(status_code=404, detail="List not found")
+        board_id = row.board_id
+        authz_cache.put(authz_cache.list_boards, list_id, board_id)
+    return board_id
+
+def board_id_for_card(db: Session, card_id: int) -> int:
+    board_id = authz_cache.get(authz_cache.card_boards, card_id)
+    if board_id is _MISSING:
+        row = db.query(DBList.board_id).join(Card, Card.list_id == DBList.id).filter(
+            Card.id == card_id
+        ).first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Card not found")
+        board_id = row.board_id
+        authz_cache.put(authz_cache.card_boards, card_id, board_id)
+    return board_id
+
+def board_role(db: Session, user_id: int, board_id: int) -> Optional[RoleEnum]:
+    """Return the user's role on the board, or None if they are not a member"""
+    key = (user_id, board_id)
+    role = authz_cache.get(authz_cache.roles, key)
+    if role is _MISSING:
+        row = db.query(BoardMember.role).filter(
+            BoardMember.board_id == board_id,
+            BoardMember.user_id == user_id
+        ).first()
+        if row:
+            role = row.role
+        elif not db.query(Board.id).filter(Board.id == board_id).first():
+            raise HTTPException(status_code=404, detail="Board not found")
+        else:
+            role = None
+        authz_cache.put(authz_cache.roles, key, role)
+    return role
+
+def authorize_board(db: Session, user_id: int, board_id: int, owner_only: bool = False) -> RoleEnum:
+    role = board_role(db, user_id, board_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this board")
+    if owner_only and role != RoleEnum.owner:
+        raise HTTPException(status_code=403, detail="Only the board owner can do this")
+    return role
+
+def authorize_list(db: Session, user_id: int, list_id: int) -> RoleEnum:
+    return authorize_board(db, user_id, board_id_for_list(db, list_id))
+
+def authorize_card(db: Session, user_id: int, card_id: int) -> RoleEnum:
+    return authorize_board(db, user_id, board_id_for_card(db, card_id))
@@ -0,0 +1,171 @@
+"""Admission control: per-user/per-IP token buckets and a global in-flight limit"""
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+from starlette.responses import JSONResponse
+
+from config import (
+    RATE_LIMITS, IP_RATE_LIMITS, RATE_LIMIT_IDLE_SECONDS, RATE_LIMIT_CLEANUP_SECONDS, RATE_LIMIT_MAX_BUCKETS,
+    MAX_IN_FLIGHT_REQUESTS, MAX_QUEUED_REQUESTS, QUEUE_TIMEOUT_SECONDS
+)
+
+class TokenBuckets:
+    """Token buckets keyed by an arbitrary tuple, stored as [tokens, last_refill] pairs.
+
+    Buckets are kept in least-recently-used order, so a full table evicts the
+    stalest client rather than resetting everyone's limits.
+    """
+
+    def __init__(self, idle_seconds: float, cleanup_seconds: float, max_buckets: int):
+        self.idle_seconds = idle_seconds
+        self.cleanup_seconds = cleanup_seconds
+        self.max_buckets = max_buckets
+        self.buckets = OrderedDict()
+        self.last_cleanup = time.monotonic()
+
+    def take(self, key: tuple, rate: float, burst: int, now: float) -> float:
+        """Consume one token; return 0 if allowed, else seconds until a token is available"""
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            while len(self.buckets) >= self.max_buckets:
+                self.buckets.popitem(last=False)
+            bucket = self.buckets[key] = [float(burst), now]
+        else:
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            self.buckets.move_to_end(key)
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / rate
+
+    def cleanup(self, now: float):
+        """Drop buckets that have been idle long enough to have refilled"""
+        if now - self.last_cleanup < self.cleanup_seconds:
+            return
+        self.last_cleanup = now
+        cutoff = now - self.idle_seconds
+        # Oldest-used buckets come first, so stop at the first recent one
+        while self.buckets and next(iter(self.buckets.values()))[1] < cutoff:
+            self.buckets.popitem(last=False)
+
+class AdmissionControlMiddleware:
+    """ASGI middleware that sheds load with 429/503 instead of queueing without bound"""
+
+    def __init__(self, app, user_limits: dict = RATE_LIMITS, ip_limits: dict = IP_RATE_LIMITS,
+                 max_in_flight: int = MAX_IN_FLIGHT_REQUESTS, max_queued: int = MAX_QUEUED_REQUESTS,
+                 queue_timeout: float = QUEUE_TIMEOUT_SECONDS):
+        self.app = app
+        self.user_limits = user_limits
+        self.ip_limits = ip_limits
+        self.buckets = TokenBuckets(RATE_LIMIT_IDLE_SECONDS, RATE_LIMIT_CLEANUP_SECONDS, RATE_LIMIT_MAX_BUCKETS)
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiters = deque()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/api"):
+            await self.app(scope, receive, send)
+            return
+
+        now = time.monotonic()
+        self.buckets.cleanup(now)
+        route_class = classify_route(scope["method"], scope["path"])
+        # Check the IP bucket first so rejected requests never create user buckets
+        retry_after = self.buckets.take(
+            (route_class, "ip", client_ip(scope)), *self.ip_limits[route_class], now
+        )
+        if not retry_after:
+            retry_after = self._take_user(route_class, scope, now)
+        if retry_after:
+            await reject(scope, receive, send, 429, "Rate limit exceeded", retry_after)
+            return
+
+        if not await self._acquire():
+            await reject(scope, receive, send, 503, "Server busy, try again shortly", self.queue_timeout)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._release()
+
+    def _take_user(self, route_class: str, scope, now: float) -> float:
+        user_id = request_user_id(scope)
+        if user_id is None:
+            return 0.0
+        return self.buckets.take((route_class, "user", user_id), *self.user_limits[route_class], now)
+
+    async def _acquire(self) -> bool:
+        if self.in_flight < self.max_in_flight and not self.waiters:
+            self.in_flight += 1
+            return True
+        if len(self.waiters) >= self.max_queued:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            return False
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def _abandon(self, waiter):
+        if waiter.done() and not waiter.cancelled():
+            # Slot was handed over just as we gave up; pass it on
+            self._release()
+            return
+        waiter.cancel()
+        if waiter in self.waiters:
+            self.waiters.remove(waiter)
+
+    def _release(self):
+        # Hand the slot directly to the oldest live waiter, keeping in_flight unchanged
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+AUTH_PATHS = ("/api/auth/login", "/api/auth/signup")
+
+def classify_route(method: str, path: str) -> str:
+    if path in AUTH_PATHS:
+        return "auth"
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return "read"
+    return "write"
+
+def client_ip(scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+def request_user_id(scope) -> Optional[int]:
+    """Extract the numeric user id from an `Authorization: Bearer token_<id>` header"""
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            parts = value.decode("latin-1").split()
+            if parts and parts[-1].startswith("token_"):
+                user_id = parts[-1][len("token_"):]
+                if user_id.isdigit() and len(user_id) <= 18:
+                    return int(user_id)
+            return None
+    return None
+
+async def reject(scope, receive, send, status_code: int, detail: str, retry_after: float):
+    response = JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+    await response(scope, receive, send)
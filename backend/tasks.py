@@ -0,0 +1,136 @@
+"""Periodic maintenance jobs run alongside the API server"""
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, exists
+from sqlalchemy.orm import selectinload
+from starlette.concurrency import run_in_threadpool
+
+from database import SessionLocal
+from models import (
+    Invite, InviteStatusEnum, List as DBList, Card,
+    ArchivedList, ArchivedCard, ArchivedComment, ArchivedCardAssignee
+)
+from config import (
+    INVITE_SWEEP_INTERVAL_SECONDS, INVITE_SWEEP_BATCH_SIZE,
+    ARCHIVE_MOVE_AFTER_DAYS, ARCHIVE_INTERVAL_SECONDS, ARCHIVE_BATCH_SIZE
+)
+
+def expire_stale_invites(batch_size: int = INVITE_SWEEP_BATCH_SIZE) -> int:
+    """Mark pending invites past their expiry as expired, one batch per transaction.
+
+    Keeping each UPDATE bounded avoids holding a long write lock on the
+    invites table while accept requests are being served.
+    """
+    db = SessionLocal()
+    expired = 0
+    try:
+        now = datetime.utcnow()
+        while True:
+            ids = [row.id for row in db.query(Invite.id).filter(
+                Invite.status == InviteStatusEnum.pending,
+                Invite.expires_at < now
+            ).order_by(Invite.expires_at).limit(batch_size).all()]
+            if not ids:
+                break
+            db.query(Invite).filter(
+                Invite.id.in_(ids),
+                Invite.status == InviteStatusEnum.pending
+            ).update({Invite.status: InviteStatusEnum.expired}, synchronize_session=False)
+            db.commit()
+            expired += len(ids)
+            if len(ids) < batch_size:
+                break
+    finally:
+        db.close()
+    return expired
+
+def move_archived_to_cold_storage(batch_size: int = ARCHIVE_BATCH_SIZE,
+                                  older_than_days: int = ARCHIVE_MOVE_AFTER_DAYS) -> int:
+    """Move cards and lists archived before the cutoff into the archive tables.
+
+    Cards go first (including every card of an archived list, with their
+    comments and assignees), `batch_size` per transaction; lists follow once
+    they have no cards left in the hot table.
+    """
+    db = SessionLocal()
+    moved = 0
+    try:
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        card_archived_at = func.coalesce(Card.archived_at, DBList.archived_at)
+        while True:
+            rows = db.query(Card, DBList.board_id, card_archived_at).join(
+                DBList, Card.list_id == DBList.id
+            ).options(
+                selectinload(Card.comments), selectinload(Card.assignees)
+            ).filter(card_archived_at < cutoff).order_by(Card.id).limit(batch_size).all()
+            if not rows:
+                break
+            for card, board_id, archived_at in rows:
+                db.add(archive_card(card, board_id, archived_at))
+                db.delete(card)
+            db.commit()
+            moved += len(rows)
+            if len(rows) < batch_size:
+                break
+        
+        while True:
+            lists = db.query(DBList).filter(
+                DBList.archived_at < cutoff,
+                ~exists().where(Card.list_id == DBList.id)
+            ).order_by(DBList.id).limit(batch_size).all()
+            if not lists:
+                break
+            for list_obj in lists:
+                db.add(ArchivedList(
+                    list_id=list_obj.id,
+                    board_id=list_obj.board_id,
+                    title=list_obj.title,
+                    position=list_obj.position,
+                    archived_at=list_obj.archived_at,
+                    created_at=list_obj.created_at,
+                    updated_at=list_obj.updated_at
+                ))
+                db.delete(list_obj)
+            db.commit()
+            moved += len(lists)
+            if len(lists) < batch_size:
+                break
+    finally:
+        db.close()
+    return moved
+
+def archive_card(card: Card, board_id: int, archived_at: datetime) -> ArchivedCard:
+    return ArchivedCard(
+        card_id=card.id,
+        list_id=card.list_id,
+        board_id=board_id,
+        title=card.title,
+        description=card.description,
+        position=card.position,
+        due_date=card.due_date,
+        archived_at=archived_at,
+        created_at=card.created_at,
+        updated_at=card.updated_at,
+        comments=[ArchivedComment(comment_id=c.id, user_id=c.user_id, content=c.content,
+                                  created_at=c.created_at, updated_at=c.updated_at)
+                  for c in card.comments],
+        assignees=[ArchivedCardAssignee(user_id=a.user_id, assigned_at=a.assigned_at)
+                   for a in card.assignees]
+    )
+
+async def run_periodically(job, interval_seconds: int):
+    """Run a blocking job in the threadpool every `interval_seconds`"""
+    while True:
+        try:
+            await run_in_threadpool(job)
+        except Exception as exc:
+            print(f"✗ Background job {job.__name__} failed: {exc}")
+        await asyncio.sleep(interval_seconds)
+
+def start_background_jobs() -> list:
+    """Schedule all maintenance jobs on the running event loop"""
+    return [
+        asyncio.create_task(run_periodically(expire_stale_invites, INVITE_SWEEP_INTERVAL_SECONDS)),
+        asyncio.create_task(run_periodically(move_archived_to_cold_storage, ARCHIVE_INTERVAL_SECONDS)),
+    ]
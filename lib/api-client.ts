@@ -97,6 +97,21 @@ export const listsApi = {
     request<{ message: string }>(`/lists/${id}`, {
       method: "DELETE",
     }),
+
+  archive: (id: number) =>
+    request<List>(`/lists/${id}/archive`, {
+      method: "POST",
+    }),
+
+  unarchive: (id: number) =>
+    request<List>(`/lists/${id}/unarchive`, {
+      method: "POST",
+    }),
+
+  getArchived: (boardId: number, cursor?: { before_archived_at: string; before_id: number }) =>
+    request<{ items: List[]; next_cursor: { before_archived_at: string; before_id: number } | null }>(
+      `/boards/${boardId}/archive/lists${cursor ? `?${new URLSearchParams(cursor as any)}` : ""}`,
+    ),
 }
 
 // Cards API
@@ -120,6 +135,21 @@ export const cardsApi = {
       method: "DELETE",
     }),
 
+  archive: (id: number) =>
+    request<Card>(`/cards/${id}/archive`, {
+      method: "POST",
+    }),
+
+  unarchive: (id: number) =>
+    request<Card>(`/cards/${id}/unarchive`, {
+      method: "POST",
+    }),
+
+  getArchived: (boardId: number, cursor?: { before_archived_at: string; before_id: number }) =>
+    request<{ items: Card[]; next_cursor: { before_archived_at: string; before_id: number } | null }>(
+      `/boards/${boardId}/archive/cards${cursor ? `?${new URLSearchParams(cursor as any)}` : ""}`,
+    ),
+
   move: (id: number, data: { list_id: number; position: number }) =>
     request<Card>(`/cards/${id}/move`, {
       method: "PUT",
@@ -155,6 +185,12 @@ export const invitesApi = {
       body: JSON.stringify(data),
     }),
 
+  createBulk: (data: { board_id: number; emails: string[] }) =>
+    request<Invite[]>("/invites/bulk", {
+      method: "POST",
+      body: JSON.stringify(data),
+    }),
+
   accept: (token: string) =>
     request<{ message: string }>(`/invites/${token}/accept`, {
       method: "POST",
@@ -33,6 +33,7 @@ export interface List {
   board_id: number
   title: string
   position: number
+  archived_at?: string | null
   created_at: string
   updated_at: string
 }
@@ -44,6 +45,7 @@ export interface Card {
   description: string | null
   position: number
   due_date: string | null
+  archived_at?: string | null
   created_at: string
   updated_at: string
 }
@@ -68,7 +70,7 @@ export interface Invite {
   id: number
   board_id: number
   email: string
-  token: string
+  token: string | null
   invited_by: number
   status: "pending" | "accepted" | "expired"
   created_at: string